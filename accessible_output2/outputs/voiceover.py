@@ -1,9 +1,13 @@
 from __future__ import absolute_import
 
 import ctypes
+import functools
 import logging
 import os
-from typing import Optional, Union
+import stat
+import sys
+import time
+from typing import Callable, Optional, Union
 
 try:
     import wx  # type: ignore
@@ -14,38 +18,82 @@ from .base import Output
 
 logger = logging.getLogger(__name__)
 
+# Prebuilt interrupt flags for vo_announce; ctypes passes c_int instances
+# through as-is instead of converting a Python int on every call.
+_VO_INT_TRUE = ctypes.c_int(1)
+_VO_INT_FALSE = ctypes.c_int(0)
+_EMPTY_UTF8 = b""
+# Messages longer than this many characters bypass the payload cache.
+_PAYLOAD_CACHE_MAX_CHARS = 128
+# How long a failed wx window lookup is trusted before wx is queried again.
+_AUTODETECT_RETRY_SECONDS = 0.05
+# Minimum delay between bridge initialization attempts triggered by is_active.
+_INIT_RETRY_SECONDS = 1.0
+
+# platform_utils.paths, imported on first use; False once the import has failed.
+_PLATFORM_PATHS = None
+_PLATFORM_PATHS_TRIED = False
+
+
+def _get_platform_paths():
+    """Return ``platform_utils.paths``, or None when it is unavailable."""
+    global _PLATFORM_PATHS, _PLATFORM_PATHS_TRIED
+    if not _PLATFORM_PATHS_TRIED:
+        _PLATFORM_PATHS_TRIED = True
+        try:
+            from platform_utils import paths  # type: ignore
+        except Exception:
+            # platform_utils is optional when running outside frozen builds.
+            paths = False
+        _PLATFORM_PATHS = paths
+    return _PLATFORM_PATHS or None
 
-class VoiceOverBridge:
+
+@functools.lru_cache(maxsize=256)
+def _cached_payload(text: str) -> ctypes.c_char_p:
+    return ctypes.c_char_p(text.encode("utf-8"))
+
+
+def _payload(text: str) -> ctypes.c_char_p:
     """
-    Thin ctypes wrapper around the libVoiceOver bridge compiled from VoiceOver.m.
+    Return ``text`` encoded as a c_char_p ready to pass to vo_announce.
+
+    Short messages such as control labels are cached so repeats skip the
+    encode and ctypes argument conversion; longer text is encoded directly
+    so the cache never pins large documents in memory.
     """
+    if len(text) > _PAYLOAD_CACHE_MAX_CHARS:
+        return ctypes.c_char_p(text.encode("utf-8"))
+    return _cached_payload(text)
 
-    def __init__(
-        self,
-        dylib_name: str = "libVoiceOver.dylib",
-        lib: Optional[ctypes.CDLL] = None,
-    ):
-        self.initialized = False
-        if lib is None:
-            self._path = self._resolve_dylib_path(dylib_name)
-            self.lib = ctypes.CDLL(self._path)
-        else:
-            self._path = getattr(lib, "__file__", "<in-memory>")
-            self.lib = lib
-        self._configure_signatures()
 
-    @staticmethod
-    def _resolve_dylib_path(dylib_name: str) -> str:
-        candidates = []
+def _is_regular_file(path: str) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    # Skip directories and other non-files that dlopen would reject anyway.
+    return stat.S_ISREG(st.st_mode)
 
-        # Package-local lib/ directory when running from source.
-        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        candidates.append(os.path.join(package_root, "lib", dylib_name))
 
-        # Application bundle or frozen binaries.
-        try:
-            from platform_utils import paths  # type: ignore
+@functools.lru_cache(maxsize=4)
+def _resolve_dylib_path_cached(dylib_name: str) -> str:
+    """
+    Locate ``dylib_name`` in the package and application lib/ directories.
+
+    A miss raises FileNotFoundError with the tuple of searched paths, so the
+    cache only ever holds paths that were found.
+    """
+    candidates = []
 
+    # Package-local lib/ directory when running from source.
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    candidates.append(os.path.join(package_root, "lib", dylib_name))
+
+    # Application bundle or frozen binaries.
+    paths = _get_platform_paths()
+    if paths is not None:
+        try:
             if paths.is_frozen():
                 candidates.append(
                     os.path.join(
@@ -69,21 +117,61 @@ class VoiceOverBridge:
                 )
             )
         except Exception:
-            # platform_utils is optional when running outside frozen builds.
-            pass
+            logger.debug("platform_utils could not report data paths", exc_info=True)
+
+    # Normalise once and drop duplicates while keeping the search order.
+    searched = tuple(
+        dict.fromkeys(os.path.abspath(candidate) for candidate in candidates if candidate)
+    )
+    for candidate in searched:
+        if _is_regular_file(candidate):
+            return candidate
+
+    raise FileNotFoundError(searched)
+
+
+class VoiceOverBridge:
+    """
+    Thin ctypes wrapper around the libVoiceOver bridge compiled from VoiceOver.m.
+    """
+
+    def __init__(
+        self,
+        dylib_name: str = "libVoiceOver.dylib",
+        lib: Optional[ctypes.CDLL] = None,
+    ):
+        self.initialized = False
+        if lib is None:
+            self._path = self._resolve_dylib_path(dylib_name)
+            self.lib = self._load_library(self._path)
+        else:
+            self._path = getattr(lib, "__file__", "<in-memory>")
+            self.lib = lib
+        self._configure_signatures()
 
-        # Absolute path relative to current working directory as a final fallback.
-        candidates.append(os.path.abspath(dylib_name))
+    @staticmethod
+    def _load_library(path: str) -> ctypes.CDLL:
+        # Lazy, local binding on macOS: only a handful of symbols are ever used.
+        if sys.platform == "darwin":
+            try:
+                return ctypes.CDLL(path, mode=os.RTLD_LAZY | os.RTLD_LOCAL)
+            except OSError as exc:
+                logger.debug("Lazy dlopen of %s failed, retrying eagerly: %s", path, exc)
+        return ctypes.CDLL(path)
 
-        searched = []
-        for candidate in candidates:
-            if not candidate:
-                continue
-            candidate = os.path.abspath(candidate)
-            if candidate in searched:
-                continue
+    @staticmethod
+    def _resolve_dylib_path(dylib_name: str) -> str:
+        try:
+            return _resolve_dylib_path_cached(dylib_name)
+        except FileNotFoundError as exc:
+            searched = list(exc.args[0])
+
+        # Path relative to current working directory as a final fallback.
+        # The working directory can change, so this is never cached.
+        candidate = os.path.abspath(dylib_name)
+        if candidate not in searched:
             searched.append(candidate)
-            if os.path.exists(candidate):
+            if _is_regular_file(candidate):
                 return candidate
 
         raise FileNotFoundError(
@@ -92,34 +180,52 @@ class VoiceOverBridge:
 
     def _configure_signatures(self) -> None:
         required = ("vo_init_with_window", "vo_is_running", "vo_announce", "vo_shutdown")
+        # One lookup per symbol; the bound functions are kept for direct calls.
+        syms = {name: getattr(self.lib, name, None) for name in required}
         for name in required:
-            if not hasattr(self.lib, name):
+            if syms[name] is None:
                 raise AttributeError("Loaded VoiceOver library missing symbol: %s" % name)
 
+        self._vo_init = syms["vo_init_with_window"]
+        self._vo_is_running = syms["vo_is_running"]
+        self._vo_announce = syms["vo_announce"]
+        self._vo_shutdown = syms["vo_shutdown"]
+
         try:
-            self.lib.vo_init_with_window.argtypes = [ctypes.c_void_p]
-            self.lib.vo_init_with_window.restype = ctypes.c_bool
-            self.lib.vo_is_running.argtypes = []
-            self.lib.vo_is_running.restype = ctypes.c_bool
-            self.lib.vo_announce.argtypes = [ctypes.c_char_p, ctypes.c_int]
-            self.lib.vo_announce.restype = ctypes.c_bool
-            self.lib.vo_shutdown.argtypes = []
-            self.lib.vo_shutdown.restype = None
+            self._vo_init.argtypes = [ctypes.c_void_p]
+            self._vo_init.restype = ctypes.c_bool
+            self._vo_is_running.argtypes = []
+            self._vo_is_running.restype = ctypes.c_bool
+            self._vo_announce.argtypes = [ctypes.c_char_p, ctypes.c_int]
+            self._vo_announce.restype = ctypes.c_bool
+            self._vo_shutdown.argtypes = []
+            self._vo_shutdown.restype = None
         except AttributeError:
             # Allow substitutes used during testing that do not expose ctypes metadata.
             pass
 
+        # Optional dedicated silence entry point; older builds only expose vo_announce.
+        self._vo_silence = getattr(self.lib, "vo_silence", None)
+        if self._vo_silence is not None:
+            try:
+                self._vo_silence.argtypes = []
+                self._vo_silence.restype = None
+            except AttributeError:
+                pass
+
     def init(self, hwnd: Union[int, ctypes.c_void_p]) -> bool:
+        if isinstance(hwnd, ctypes.c_void_p):
+            hwnd = hwnd.value
         if hwnd in (None, 0):
             raise ValueError("VoiceOver init requires a valid window handle")
 
-        ptr = hwnd if isinstance(hwnd, ctypes.c_void_p) else ctypes.c_void_p(int(hwnd))
-        ok = self.lib.vo_init_with_window(ptr)
-        self.initialized = bool(ok)
+        # argtypes converts the plain int to a pointer; no c_void_p wrapper needed.
+        # bool() keeps the flag a real bool for substitute libraries without restype.
+        self.initialized = bool(self._vo_init(int(hwnd)))
         return self.initialized
 
     def is_running(self) -> bool:
-        return bool(self.lib.vo_is_running())
+        return bool(self._vo_is_running())
 
     def speak(self, text: str, interrupt: bool = True) -> bool:
         if not self.initialized:
@@ -127,11 +233,19 @@ class VoiceOverBridge:
         if not isinstance(text, str):
             raise TypeError("VoiceOver.speak expects a string message")
 
-        payload = text.encode("utf-8")
-        return bool(self.lib.vo_announce(payload, 1 if interrupt else 0))
+        payload = _payload(text)
+        flag = _VO_INT_TRUE if interrupt else _VO_INT_FALSE
+        return self._vo_announce(payload, flag)
+
+    def _silence_fast(self) -> bool:
+        """Interrupt current speech without the checks and encoding done by speak."""
+        if self._vo_silence is not None:
+            self._vo_silence()
+            return True
+        return self._vo_announce(_EMPTY_UTF8, _VO_INT_TRUE)
 
     def shutdown(self) -> None:
-        self.lib.vo_shutdown()
+        self._vo_shutdown()
         self.initialized = False
 
 
@@ -145,10 +259,15 @@ class VoiceOver(Output):
     def __init__(self, *args, **kwargs):
         super().__init__()
         self._bridge: Optional[VoiceOverBridge] = None
-        self._window_handle: Optional[ctypes.c_void_p] = None
+        self._window_handle: Optional[int] = None
         self._initialization_attempted = False
         self._initialized = False
         self._last_error: Optional[Exception] = None
+        # The bridge's vo_announce function, set once initialization succeeds.
+        self._announce: Optional[Callable[[ctypes.c_char_p, ctypes.c_int], bool]] = None
+        self._last_autodetect_time = 0.0
+        # When the last initialization attempt failed; None once it succeeds.
+        self._last_init_failure: Optional[float] = None
 
     def set_main_window(self, window) -> None:
         """Allow the application to provide an explicit wx window handle."""
@@ -157,12 +276,14 @@ class VoiceOver(Output):
             self._window_handle = handle
             self._initialization_attempted = False
             self._initialized = False
+            self._announce = None
             if self._bridge is not None:
+                # Keep the loaded dylib; _ensure_bridge re-inits it with the new handle.
                 try:
                     self._bridge.shutdown()
                 except Exception:
-                    pass
-                self._bridge = None
+                    # The bridge is in an unknown state; force a clean reload.
+                    self._bridge = None
 
     def _ensure_bridge(self) -> bool:
         if self._initialized and self._bridge:
@@ -174,6 +295,7 @@ class VoiceOver(Output):
             except Exception as exc:
                 self._last_error = exc
                 logger.error("Failed to construct VoiceOver bridge: %s", exc)
+                self._last_init_failure = time.monotonic()
                 return False
 
         handle = self._window_handle or self._auto_detect_window_handle()
@@ -181,23 +303,33 @@ class VoiceOver(Output):
             if not self._initialization_attempted:
                 logger.debug("VoiceOver window handle unavailable; deferring initialization")
             self._initialization_attempted = True
+            self._last_init_failure = time.monotonic()
             return False
 
         try:
             if self._bridge.init(handle):
                 self._initialized = True
                 self._initialization_attempted = True
+                self._announce = self._bridge._vo_announce
+                self._last_init_failure = None
                 return True
             logger.error("VoiceOver bridge initialization returned False")
         except Exception as exc:
             self._last_error = exc
             logger.error("VoiceOver bridge initialization failed: %s", exc)
         self._initialization_attempted = True
+        self._last_init_failure = time.monotonic()
         return False
 
-    def _auto_detect_window_handle(self) -> Optional[ctypes.c_void_p]:
+    def _auto_detect_window_handle(self) -> Optional[int]:
         if wx is None:
             return None
+        # A successful lookup is stored in _window_handle, so reaching this
+        # point means the previous attempt found nothing.
+        now = time.monotonic()
+        if now - self._last_autodetect_time < _AUTODETECT_RETRY_SECONDS:
+            return None
+        self._last_autodetect_time = now
         app = wx.GetApp()
         if app is None:
             return None
@@ -210,39 +342,43 @@ class VoiceOver(Output):
         return handle
 
     @staticmethod
-    def _extract_handle(window) -> Optional[ctypes.c_void_p]:
+    def _extract_handle(window) -> Optional[int]:
         if window is None:
             return None
 
-        handle = None
-        if hasattr(window, "MacGetTopLevelWindowRef"):
-            try:
-                handle = window.MacGetTopLevelWindowRef()
-            except Exception:
-                handle = None
-        elif hasattr(window, "GetHandle"):
-            try:
-                handle = window.GetHandle()
-            except Exception:
-                handle = None
+        getter = getattr(window, "MacGetTopLevelWindowRef", None) or getattr(
+            window, "GetHandle", None
+        )
+        if getter is None:
+            return None
+        try:
+            handle = getter()
+        except Exception:
+            return None
 
         if handle in (None, 0):
             return None
 
         if isinstance(handle, ctypes.c_void_p):
-            return handle
+            return handle.value
 
         try:
-            return ctypes.c_void_p(int(handle))
+            return int(handle)
         except (TypeError, ValueError):
             logger.error("Could not convert wx window handle %r to pointer", handle)
             return None
 
     def speak(self, text, interrupt=False):
-        if not self._ensure_bridge():
-            return False
+        # Calls vo_announce directly rather than through VoiceOverBridge.speak
+        # to keep a Python frame off the per-announcement path.
+        announce = self._announce
+        if announce is None:
+            if not self._ensure_bridge():
+                return False
+            announce = self._announce
         try:
-            return self._bridge.speak(text, bool(interrupt))
+            flag = _VO_INT_TRUE if interrupt else _VO_INT_FALSE
+            return announce(_payload(text), flag)
         except Exception as exc:
             logger.error("VoiceOver speak failed: %s", exc)
             return False
@@ -251,12 +387,16 @@ class VoiceOver(Output):
         if not self._bridge or not getattr(self._bridge, "initialized", False):
             return
         try:
-            self._bridge.speak("", True)
+            self._bridge._silence_fast()
         except Exception as exc:
             logger.debug("VoiceOver silence failed: %s", exc)
 
     def is_active(self):
         if not self._bridge:
+            # Don't retry a recently failed initialization on every poll.
+            failed_at = self._last_init_failure
+            if failed_at is not None and time.monotonic() - failed_at < _INIT_RETRY_SECONDS:
+                return False
             # Attempt initialization to verify VoiceOver state
             self._ensure_bridge()
         if not self._bridge:
@@ -276,6 +416,8 @@ class VoiceOver(Output):
             finally:
                 self._bridge = None
                 self._initialized = False
+                self._announce = None
+                self._last_init_failure = None
 
 
 output_class = VoiceOver